@@ -1,4 +1,7 @@
+import queue
+import threading
 import numpy as np
+from scipy.signal import lfilter
 import tkinter as tk
 from tkinter import ttk, messagebox
 import matplotlib.pyplot as plt
@@ -7,13 +10,118 @@ from matplotlib.figure import Figure
 from datetime import datetime, timedelta
 import pandas as pd
 
+try:
+    from numba import njit, prange
+except ImportError:  # Numba is optional; fall back to the NumPy valuation
+    njit = None
+
+try:
+    import cupy as cp
+    from cupyx.scipy.signal import lfilter as cp_lfilter
+except ImportError:  # CuPy is optional; only needed for device='cuda'
+    cp = None
+
+
+def _swap_values_kernel(rates, notional, fixed_rate, dt, time_steps, sim_block, swap_values):
+    """
+    Value the swap on every date and path with explicit loops (Numba kernel),
+    writing into swap_values. Arrays are time-major: (time_steps + 1, paths).
+    """
+    num_simulations = rates.shape[1]
+    num_blocks = (num_simulations + sim_block - 1) // sim_block
+
+    # Parallelise over blocks of paths: every block does the same triangular
+    # amount of work over the dates, so threads stay evenly loaded
+    for block in prange(num_blocks):
+        first = block * sim_block
+        last = min(first + sim_block, num_simulations)
+
+        for t in range(time_steps + 1):
+            # Discount at the spot rate r_t, rolling the factor forward one
+            # period at a time instead of calling exp per payment; the sums
+            # are accumulated in float64 whatever the storage dtype
+            step = np.exp(-rates[t, first:last] * dt)
+            discount_factor = np.ones(last - first)
+            fixed_leg_pv = np.zeros(last - first)
+            floating_leg_pv = np.zeros(last - first)
+
+            # The innermost loop runs along a contiguous stretch of one time slice
+            for future_t in range(t + 1, time_steps + 1):
+                forward_rates = rates[future_t-1, first:last]
+                for i in range(last - first):
+                    discount_factor[i] *= step[i]
+                    fixed_leg_pv[i] += discount_factor[i]
+                    floating_leg_pv[i] += forward_rates[i] * discount_factor[i]
+
+            # Swap value (receive fixed, pay floating); zero at maturity
+            values = swap_values[t, first:last]
+            for i in range(last - first):
+                values[i] = notional * dt * (fixed_rate * fixed_leg_pv[i] - floating_leg_pv[i])
+
+
+if njit is not None:
+    _swap_values_kernel = njit(parallel=True, fastmath=True, cache=True)(_swap_values_kernel)
+
+
 class InterestRateSwapCVA:
     """
     Calculate CVA for Interest Rate Swap using Monte Carlo simulation
     """
+
+    # Valuation dates per discount-factor block in the NumPy/CuPy pricer
+    df_block_size = 8
+
+    # Paths per parallel work item in the Numba pricer
+    kernel_sim_block = 128
+
+    # Swap value paths returned to the host for plotting
+    num_sample_paths = 20
     
     def __init__(self, notional, fixed_rate, maturity_years, 
-                 counterparty_spread, recovery_rate, num_simulations=1000):
+                 counterparty_spread, recovery_rate, num_simulations=1000,
+                 device='cpu', seed=None, antithetic=True):
+        self.set_parameters(notional, fixed_rate, maturity_years,
+                            counterparty_spread, recovery_rate, num_simulations)
+
+        # Array backend: NumPy on the CPU, CuPy on a CUDA device
+        if device == 'cuda':
+            if cp is None:
+                raise ImportError("CuPy is required for device='cuda'")
+            self.xp = cp
+            self.lfilter = cp_lfilter
+        elif device == 'cpu':
+            self.xp = np
+            self.lfilter = lfilter
+        else:
+            raise ValueError(f"Unknown device: {device}")
+        self.device = device
+
+        # Seedable Generator on the chosen device (PCG64 on the CPU); pass a
+        # seed for reproducible paths
+        self.rng = self.xp.random.default_rng(seed)
+
+        # Pair each Brownian path with its mirror image (-dW) to reduce the
+        # variance of the exposure estimates for the same number of paths
+        self.antithetic = antithetic
+
+        # Rate paths and swap values are stored in float32: the Monte Carlo
+        # error dominates single-precision rounding, and it halves memory
+        # traffic. CVA itself is accumulated in float64.
+        self.dtype = np.float32
+
+        # Work arrays, allocated on first use and reused across runs while
+        # their shapes still match
+        self._rates_buf = None
+        self._swap_buf = None
+        self._df_buf = None
+        self._scratch_buf = None
+
+    def set_parameters(self, notional, fixed_rate, maturity_years,
+                       counterparty_spread, recovery_rate, num_simulations=1000):
+        """
+        Update the swap and credit parameters, keeping the work arrays so a
+        recalculation does not reallocate them
+        """
         self.notional = notional
         self.fixed_rate = fixed_rate
         self.maturity_years = maturity_years
@@ -21,95 +129,222 @@ class InterestRateSwapCVA:
         self.recovery_rate = recovery_rate
         self.num_simulations = num_simulations
         self.time_steps = int(maturity_years * 12)  # Monthly steps
+
+        # CVA weights depend on the spread and the time grid; rebuild on demand
+        self._cva_weights = None
+        self._cva_weights_key = None
+
+    def _buffer(self, name, shape):
+        """
+        Return the work array stored under name, reallocating it only when
+        the requested shape changes
+        """
+        buf = getattr(self, name)
+        if buf is None or buf.shape != shape:
+            buf = self.xp.empty(shape, dtype=self.dtype)
+            setattr(self, name, buf)
+        return buf
         
     def simulate_interest_rates(self, initial_rate=0.03, volatility=0.01):
         """
         Simulate interest rate paths using Hull-White model
+
+        Paths are stored time-major, shape (time_steps + 1, num_simulations),
+        so each time slice is contiguous.
         """
+        xp = self.xp
         dt = 1/12  # Monthly time step
-        rates = np.zeros((self.num_simulations, self.time_steps + 1))
-        rates[:, 0] = initial_rate
-        
+        rates = self._buffer('_rates_buf', (self.time_steps + 1, self.num_simulations))
+        rates[0] = initial_rate
+
         # Mean reversion parameters
         kappa = 0.1  # Mean reversion speed
         theta = 0.03  # Long-term mean
-        
-        for t in range(1, self.time_steps + 1):
-            dW = np.random.normal(0, np.sqrt(dt), self.num_simulations)
-            rates[:, t] = rates[:, t-1] + kappa * (theta - rates[:, t-1]) * dt + volatility * dW
-            
+
+        # Draw all Brownian increments in one call, straight into the rows
+        # they will be filtered in
+        dW = rates[1:]
+        if self.antithetic:
+            # Draw half the paths and mirror them; with an odd count the
+            # last draw has no partner
+            half = (self.num_simulations + 1) // 2
+            draws = self.rng.standard_normal((self.time_steps, half), dtype=self.dtype)
+            dW[:, :half] = draws
+            xp.negative(draws[:, :self.num_simulations - half], out=dW[:, half:])
+        else:
+            self.rng.standard_normal(dtype=self.dtype, out=dW)
+
+        # The Euler step r_{t+1} = a * r_t + b + volatility * dW_t is a
+        # first-order IIR filter over the shocks b + volatility * dW_t, with
+        # r_0 entering through the filter's initial state a * r_0. One
+        # lfilter call then runs the whole recursion for every path.
+        a = 1 - kappa * dt
+        b = kappa * theta * dt
+        dW *= self.dtype(volatility * np.sqrt(dt))
+        dW += self.dtype(b)
+        initial_state = xp.full((1, self.num_simulations), a * initial_rate, dtype=self.dtype)
+        rates[1:], _ = self.lfilter(xp.asarray([1], dtype=self.dtype),
+                                    xp.asarray([1, -a], dtype=self.dtype),
+                                    dW, axis=0, zi=initial_state)
+
         return rates
     
     def calculate_swap_values(self, rate_paths):
         """
-        Calculate swap mark-to-market values for all paths and time steps
+        Calculate swap mark-to-market values for all time steps and paths
+        (time-major, like rate_paths)
         """
-        swap_values = np.zeros((self.num_simulations, self.time_steps + 1))
+        xp = self.xp
         dt = 1/12
-        
-        for t in range(self.time_steps + 1):
-            remaining_time = self.maturity_years - t * dt
-            if remaining_time <= 0:
-                continue
-                
-            # Discount factors
-            remaining_steps = self.time_steps - t
-            for sim in range(self.num_simulations):
-                # Calculate PV of fixed leg
-                fixed_leg_pv = 0
-                floating_leg_pv = 0
-                
-                for future_t in range(t + 1, self.time_steps + 1):
-                    time_to_payment = (future_t - t) * dt
-                    discount_factor = np.exp(-rate_paths[sim, t] * time_to_payment)
-                    
-                    # Fixed leg payment
-                    fixed_leg_pv += self.notional * self.fixed_rate * dt * discount_factor
-                    
-                    # Floating leg payment (simplified)
-                    forward_rate = rate_paths[sim, future_t-1]
-                    floating_leg_pv += self.notional * forward_rate * dt * discount_factor
-                
-                # Swap value (receive fixed, pay floating)
-                swap_values[sim, t] = fixed_leg_pv - floating_leg_pv
-                
+
+        swap_values = self._buffer('_swap_buf', (self.time_steps + 1, self.num_simulations))
+
+        if njit is not None and xp is np:
+            _swap_values_kernel(rate_paths, self.notional, self.fixed_rate,
+                                dt, self.time_steps, self.kernel_sim_block, swap_values)
+            return swap_values
+
+        steps = xp.arange(self.time_steps + 1, dtype=self.dtype)
+
+        # Fixed leg payment: its discount factors exp(-k * r_t * dt) form a
+        # geometric series in k, so the leg is a closed-form annuity of r_t,
+        # exp(-x) * expm1(-n * x) / expm1(-x) with x = r_t * dt, n payments
+        # left, and the limit n at x = 0. It is zero at maturity.
+        x = rate_paths * dt
+        remaining = (self.time_steps - steps)[:, None]
+        denominator = xp.expm1(-x)
+        annuity = xp.where(denominator != 0,
+                           xp.exp(-x) * xp.expm1(-remaining * x) / xp.where(denominator != 0, denominator, 1),
+                           remaining)
+        xp.multiply(annuity, self.notional * self.fixed_rate * dt, out=swap_values)
+
+        # Negated time to payment for every (valuation date t, payment date u)
+        # pair, shared by all paths; only payments strictly after t contribute
+        neg_time_to_payment = (steps[:, None] - steps[None, :]) * dt
+        mask = xp.triu(xp.ones((self.time_steps + 1, self.time_steps + 1), dtype=self.dtype), k=1)
+
+        # Work through the valuation dates in blocks so the discount tensor
+        # stays at block x T x N rather than T x T x N
+        block = self._buffer('_df_buf', (self.df_block_size, self.time_steps, self.num_simulations))
+        for start in range(0, self.time_steps, self.df_block_size):
+            stop = min(start + self.df_block_size, self.time_steps)
+            payments = slice(start + 1, None)
+
+            # Floating leg discount factors DF[t, u, sim] at the spot rate
+            # r_t, from a single exp over the whole block
+            discount_factors = block[:stop - start, :self.time_steps - start]
+            xp.multiply(rate_paths[start:stop, None, :], neg_time_to_payment[start:stop, payments, None],
+                        out=discount_factors)
+            xp.exp(discount_factors, out=discount_factors)
+            discount_factors *= mask[start:stop, payments, None]
+
+            # Floating leg payment (simplified): the payment at u fixes at
+            # r_{u-1}, so payments start+1.. read the rate rows start..T-1
+            floating_leg_pv = self.notional * dt * xp.einsum(
+                'tus,us->ts', discount_factors, rate_paths[start:-1])
+
+            # Swap value (receive fixed, pay floating)
+            swap_values[start:stop] -= floating_leg_pv
+
         return swap_values
     
     def calculate_exposure_profiles(self, swap_values):
         """
         Calculate Expected Positive Exposure (EPE) and Expected Negative Exposure (ENE)
         """
-        positive_exposures = np.maximum(swap_values, 0)
-        negative_exposures = np.minimum(swap_values, 0)
-        
-        epe = np.mean(positive_exposures, axis=0)
-        ene = np.mean(negative_exposures, axis=0)
-        
-        # Also calculate percentiles
-        epe_95 = np.percentile(positive_exposures, 95, axis=0)
-        ene_5 = np.percentile(negative_exposures, 5, axis=0)
-        
+        # Reuse one scratch buffer for both sides instead of materialising
+        # separate positive and negative copies of swap_values
+        xp = self.xp
+        scratch = self._buffer('_scratch_buf', swap_values.shape)
+
+        # Positive side; reductions run along contiguous time slices
+        xp.clip(swap_values, 0, None, out=scratch)
+        epe = xp.mean(scratch, axis=1)
+        epe_95 = self._percentile(scratch, 95)
+
+        # Negative side
+        xp.clip(swap_values, None, 0, out=scratch)
+        ene = xp.mean(scratch, axis=1)
+        ene_5 = self._percentile(scratch, 5)
+
         return epe, ene, epe_95, ene_5
     
+    def _percentile(self, values, q):
+        """
+        Linearly interpolated q-th percentile along axis 1, as np.percentile
+        computes it, but from an in-place O(N) partition of values on the two
+        neighbouring ranks rather than a full sort
+        """
+        last = values.shape[1] - 1
+        position = q / 100 * last
+        k = int(position)
+        k_next = min(k + 1, last)
+        values.partition([k, k_next], axis=1)
+        lower = values[:, k]
+        return lower + (position - k) * (values[:, k_next] - lower)
+    
     def calculate_cva(self, epe, time_grid):
         """
         Calculate CVA using EPE profile and counterparty default probability
+
+        time_grid must be uniform and start at 0, like the grid built in
+        run_analysis.
         """
-        dt = 1/12
-        survival_prob = np.exp(-self.counterparty_spread * time_grid)
-        default_prob = -np.diff(survival_prob, prepend=1)
+        epe = np.asarray(epe, dtype=np.float64)
         
-        # CVA = LGD * sum(EPE * PD * DF)
+        # CVA = LGD * sum(EPE * PD * DF) = LGD * (EPE . weights)
         lgd = 1 - self.recovery_rate
-        discount_factors = np.exp(-0.03 * time_grid)  # Risk-free discount
-        
-        cva = lgd * np.sum(epe * default_prob * discount_factors)
+        cva = lgd * np.dot(epe, self.cva_weights(time_grid))
         
         return cva
     
+    def cva_weights(self, time_grid):
+        """
+        Return PD * DF per grid point, cached until the counterparty spread
+        or the time grid change. The grid must be uniform and start at 0,
+        so its length and end point identify it.
+        """
+        time_grid = np.asarray(time_grid, dtype=np.float64)
+        steps = len(time_grid) - 1
+        periods = np.diff(time_grid)
+        dt = periods[0] if steps else 0.0
+        if time_grid[0] != 0 or not np.allclose(periods, dt):
+            raise ValueError("time_grid must be uniform and start at 0")
+        
+        key = (self.counterparty_spread, steps, float(time_grid[-1]))
+        if self._cva_weights is not None and self._cva_weights_key == key:
+            return self._cva_weights
+        
+        # The grid is uniform and both the hazard rate and the risk-free rate
+        # are flat, so each period scales survival and discounting by a
+        # constant factor: one exp per curve plus a cumulative product
+        survival_prob = np.concatenate(
+            ([1.0], np.cumprod(np.full(steps, np.exp(-self.counterparty_spread * dt)))))
+        default_prob = np.diff(-survival_prob, prepend=-1.0)
+        discount_factors = np.concatenate(
+            ([1.0], np.cumprod(np.full(steps, np.exp(-0.03 * dt)))))  # Risk-free discount
+        
+        self._cva_weights = default_prob * discount_factors
+        self._cva_weights_key = key
+        return self._cva_weights
+    
+    def to_host(self, array):
+        """
+        Return a NumPy copy of an array produced on the configured device
+        """
+        if self.xp is np:
+            return array
+        return cp.asnumpy(array)
+    
     def run_analysis(self):
         """
         Run the complete CVA analysis
+
+        'rate_paths' and 'swap_values' in the result are time-major,
+        shape (time_steps + 1, num_simulations), and stay on the configured
+        device. On the CPU they are the instance's work arrays and are
+        overwritten by the next run. 'sample_paths' is a separate host copy
+        of the first num_sample_paths columns of swap_values.
         """
         # Simulate interest rates
         rate_paths = self.simulate_interest_rates()
@@ -117,8 +352,13 @@ class InterestRateSwapCVA:
         # Calculate swap values
         swap_values = self.calculate_swap_values(rate_paths)
         
-        # Calculate exposure profiles
+        # Calculate exposure profiles and bring them back to the host, along
+        # with the few sample paths the GUI plots; the full path arrays
+        # stay on the device
         epe, ene, epe_95, ene_5 = self.calculate_exposure_profiles(swap_values)
+        epe, ene, epe_95, ene_5 = (self.to_host(epe), self.to_host(ene),
+                                   self.to_host(epe_95), self.to_host(ene_5))
+        sample_paths = np.array(self.to_host(swap_values[:, :self.num_sample_paths]))
         
         # Time grid
         time_grid = np.linspace(0, self.maturity_years, self.time_steps + 1)
@@ -134,7 +374,8 @@ class InterestRateSwapCVA:
             'ene_5': ene_5,
             'cva': cva,
             'rate_paths': rate_paths,
-            'swap_values': swap_values
+            'swap_values': swap_values,
+            'sample_paths': sample_paths
         }
 
 class CVACalculatorGUI:
@@ -147,6 +388,12 @@ class CVACalculatorGUI:
         self.root.title("CVA Calculator - Interest Rate Swap")
         self.root.geometry("1200x800")
         
+        # CVA engine, created on the first calculation
+        self.swap_cva = None
+        
+        # Results handed back from the background calculation thread
+        self.results_queue = queue.Queue()
+        
         # Style
         style = ttk.Style()
         style.theme_use('clam')
@@ -187,9 +434,9 @@ class CVACalculatorGUI:
             ttk.Entry(input_frame, textvariable=var, width=15).grid(row=i, column=1, padx=5, pady=2)
         
         # Calculate button
-        ttk.Button(input_frame, text="Calculate CVA", 
-                  command=self.calculate_cva).grid(row=len(parameters)+1, column=0, 
-                                                   columnspan=2, pady=10)
+        self.calculate_button = ttk.Button(input_frame, text="Calculate CVA", 
+                                           command=self.calculate_cva)
+        self.calculate_button.grid(row=len(parameters)+1, column=0, columnspan=2, pady=10)
         
     def create_results_frame(self):
         """Create results display frame"""
@@ -200,6 +447,7 @@ class CVACalculatorGUI:
         self.results_text = tk.Text(results_frame, width=40, height=20, 
                                    font=("Courier", 10))
         self.results_text.grid(row=0, column=0, sticky="nsew")
+        self.results_text.configure(state='disabled')
         
         # Scrollbar
         scrollbar = ttk.Scrollbar(results_frame, command=self.results_text.yview)
@@ -216,6 +464,43 @@ class CVACalculatorGUI:
         self.root.grid_columnconfigure(0, weight=1)
         self.root.grid_columnconfigure(1, weight=1)
         
+        # Create the figure and its lines once; plot_results only swaps
+        # in new data on each calculation
+        self.fig = Figure(figsize=(10, 4), dpi=100)
+        
+        # Plot 1: Expected Exposures
+        self.ax1 = self.fig.add_subplot(1, 2, 1)
+        self.epe_line, = self.ax1.plot([], [], 'b-', label='EPE', linewidth=2)
+        self.epe_95_line, = self.ax1.plot([], [], 'b--', label='95% EPE', alpha=0.7)
+        self.ene_abs_line, = self.ax1.plot([], [], 'r-', label='|ENE|', linewidth=2)
+        self.ene_5_abs_line, = self.ax1.plot([], [], 'r--', label='5% |ENE|', alpha=0.7)
+        self.ax1.set_xlabel('Time (years)')
+        self.ax1.set_ylabel('Exposure ($)')
+        self.ax1.set_title('Expected Positive/Negative Exposure')
+        self.ax1.legend()
+        self.ax1.grid(True, alpha=0.3)
+        self.ax1.ticklabel_format(style='plain', axis='y')
+        
+        # Plot 2: Sample paths (path lines are added on the first calculation)
+        self.ax2 = self.fig.add_subplot(1, 2, 2)
+        self.path_lines = []
+        self.ax2_epe_line, = self.ax2.plot([], [], 'b-', label='EPE', linewidth=2)
+        self.ax2_ene_line, = self.ax2.plot([], [], 'r-', label='ENE', linewidth=2)
+        self.ax2.axhline(y=0, color='black', linestyle='-', alpha=0.5)
+        self.ax2.set_xlabel('Time (years)')
+        self.ax2.set_ylabel('Swap Value ($)')
+        self.ax2.set_title('Sample Swap Value Paths')
+        self.ax2.legend()
+        self.ax2.grid(True, alpha=0.3)
+        self.ax2.ticklabel_format(style='plain', axis='y')
+        
+        self.fig.tight_layout()
+        
+        # Embed in tkinter
+        self.canvas = FigureCanvasTkAgg(self.fig, master=plot_frame)
+        self.canvas.draw()
+        self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
     def set_default_values(self):
         """Set default parameter values"""
         self.counterparty_var.set("ABC Corporation")
@@ -227,7 +512,7 @@ class CVACalculatorGUI:
         self.entries['simulations'].set(1000)
         
     def calculate_cva(self):
-        """Run CVA calculation"""
+        """Start a CVA calculation in a background thread"""
         try:
             # Get parameters
             notional = self.entries['notional'].get() * 1e6  # Convert to actual amount
@@ -237,124 +522,136 @@ class CVACalculatorGUI:
             recovery = self.entries['recovery'].get() / 100
             simulations = self.entries['simulations'].get()
             
-            # Create swap object and run analysis
-            swap_cva = InterestRateSwapCVA(
-                notional, fixed_rate, maturity, 
-                cp_spread, recovery, simulations
-            )
-            
-            results = swap_cva.run_analysis()
-            
-            # Display results
-            self.display_results(results, swap_cva)
-            self.plot_results(results)
+            # Create the swap object once, then reuse it (and its work
+            # arrays) on later runs
+            if self.swap_cva is None:
+                self.swap_cva = InterestRateSwapCVA(
+                    notional, fixed_rate, maturity, 
+                    cp_spread, recovery, simulations
+                )
+            else:
+                self.swap_cva.set_parameters(
+                    notional, fixed_rate, maturity,
+                    cp_spread, recovery, simulations
+                )
             
         except Exception as e:
             messagebox.showerror("Error", f"Calculation error: {str(e)}")
+            return
+        
+        # Run the simulation off the Tk main thread so the window stays
+        # responsive; one run at a time since it reuses the engine's arrays
+        self.calculate_button.configure(state='disabled')
+        threading.Thread(target=self._run_mc, args=(self.swap_cva,), daemon=True).start()
+        self.root.after(100, self._poll_queue)
+        
+    def _run_mc(self, swap_cva):
+        """Run the analysis on a worker thread and queue the outcome"""
+        try:
+            self.results_queue.put((swap_cva.run_analysis(), None))
+        except Exception as e:
+            self.results_queue.put((None, e))
             
-    def display_results(self, results, swap_cva):
-        """Display calculation results"""
-        self.results_text.delete(1.0, tk.END)
+    def _poll_queue(self):
+        """Show the results once the worker thread has finished"""
+        try:
+            results, error = self.results_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(100, self._poll_queue)
+            return
         
-        # Header
-        self.results_text.insert(tk.END, "="*40 + "\n")
-        self.results_text.insert(tk.END, "CVA CALCULATION RESULTS\n")
-        self.results_text.insert(tk.END, "="*40 + "\n\n")
+        self.calculate_button.configure(state='normal')
+        if error is not None:
+            messagebox.showerror("Error", f"Calculation error: {str(error)}")
+            return
         
-        # Counterparty info
-        self.results_text.insert(tk.END, f"Counterparty: {self.counterparty_var.get()}\n")
-        self.results_text.insert(tk.END, f"Calculation Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n")
-        
-        # Swap details
-        self.results_text.insert(tk.END, "SWAP DETAILS:\n")
-        self.results_text.insert(tk.END, "-"*40 + "\n")
-        self.results_text.insert(tk.END, f"Notional: ${swap_cva.notional:,.0f}\n")
-        self.results_text.insert(tk.END, f"Fixed Rate: {swap_cva.fixed_rate*100:.2f}%\n")
-        self.results_text.insert(tk.END, f"Maturity: {swap_cva.maturity_years} years\n")
-        self.results_text.insert(tk.END, f"Position: Receive Fixed, Pay Floating\n\n")
-        
-        # Credit parameters
-        self.results_text.insert(tk.END, "CREDIT PARAMETERS:\n")
-        self.results_text.insert(tk.END, "-"*40 + "\n")
-        self.results_text.insert(tk.END, f"Counterparty Spread: {swap_cva.counterparty_spread*10000:.0f} bps\n")
-        self.results_text.insert(tk.END, f"Recovery Rate: {swap_cva.recovery_rate*100:.0f}%\n")
-        self.results_text.insert(tk.END, f"Simulations: {swap_cva.num_simulations:,}\n\n")
-        
-        # CVA results
-        self.results_text.insert(tk.END, "CVA RESULTS:\n")
-        self.results_text.insert(tk.END, "-"*40 + "\n")
-        self.results_text.insert(tk.END, f"CVA: ${results['cva']:,.2f}\n")
-        self.results_text.insert(tk.END, f"CVA (bps of notional): {results['cva']/swap_cva.notional*10000:.1f} bps\n\n")
-        
-        # Exposure statistics
-        self.results_text.insert(tk.END, "EXPOSURE STATISTICS:\n")
-        self.results_text.insert(tk.END, "-"*40 + "\n")
+        # Display results
+        self.display_results(results, self.swap_cva)
+        self.plot_results(results)
+            
+    def display_results(self, results, swap_cva):
+        """Display calculation results"""
         max_epe = np.max(results['epe'])
         mean_epe = np.mean(results['epe'])
         max_ene = np.min(results['ene'])
         mean_ene = np.mean(results['ene'])
         
-        self.results_text.insert(tk.END, f"Maximum EPE: ${max_epe:,.2f}\n")
-        self.results_text.insert(tk.END, f"Average EPE: ${mean_epe:,.2f}\n")
-        self.results_text.insert(tk.END, f"Maximum ENE: ${abs(max_ene):,.2f}\n")
-        self.results_text.insert(tk.END, f"Average ENE: ${abs(mean_ene):,.2f}\n")
+        # Build the whole report first so the Text widget is updated once
+        lines = [
+            # Header
+            "="*40,
+            "CVA CALCULATION RESULTS",
+            "="*40,
+            "",
+            # Counterparty info
+            f"Counterparty: {self.counterparty_var.get()}",
+            f"Calculation Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+            "",
+            # Swap details
+            "SWAP DETAILS:",
+            "-"*40,
+            f"Notional: ${swap_cva.notional:,.0f}",
+            f"Fixed Rate: {swap_cva.fixed_rate*100:.2f}%",
+            f"Maturity: {swap_cva.maturity_years} years",
+            "Position: Receive Fixed, Pay Floating",
+            "",
+            # Credit parameters
+            "CREDIT PARAMETERS:",
+            "-"*40,
+            f"Counterparty Spread: {swap_cva.counterparty_spread*10000:.0f} bps",
+            f"Recovery Rate: {swap_cva.recovery_rate*100:.0f}%",
+            f"Simulations: {swap_cva.num_simulations:,}",
+            "",
+            # CVA results
+            "CVA RESULTS:",
+            "-"*40,
+            f"CVA: ${results['cva']:,.2f}",
+            f"CVA (bps of notional): {results['cva']/swap_cva.notional*10000:.1f} bps",
+            "",
+            # Exposure statistics
+            "EXPOSURE STATISTICS:",
+            "-"*40,
+            f"Maximum EPE: ${max_epe:,.2f}",
+            f"Average EPE: ${mean_epe:,.2f}",
+            f"Maximum ENE: ${abs(max_ene):,.2f}",
+            f"Average ENE: ${abs(mean_ene):,.2f}",
+        ]
+        
+        # The widget is read-only outside of this update
+        self.results_text.configure(state='normal')
+        self.results_text.delete(1.0, tk.END)
+        self.results_text.insert(tk.END, "\n".join(lines) + "\n")
+        self.results_text.configure(state='disabled')
         
     def plot_results(self, results):
         """Plot exposure profiles"""
-        # Clear previous plot
-        for widget in self.root.grid_slaves(row=1, column=0):
-            if isinstance(widget, ttk.LabelFrame) and widget['text'] == 'Exposure Profiles':
-                for child in widget.winfo_children():
-                    child.destroy()
-                    
-        # Get plot frame
-        plot_frame = None
-        for widget in self.root.grid_slaves(row=1, column=0):
-            if isinstance(widget, ttk.LabelFrame) and widget['text'] == 'Exposure Profiles':
-                plot_frame = widget
-                break
-                
-        if not plot_frame:
-            return
-            
-        # Create figure
-        fig = Figure(figsize=(10, 4), dpi=100)
+        time_grid = results['time_grid']
+        sample_paths = results['sample_paths']
         
         # Plot 1: Expected Exposures
-        ax1 = fig.add_subplot(1, 2, 1)
-        ax1.plot(results['time_grid'], results['epe'], 'b-', label='EPE', linewidth=2)
-        ax1.plot(results['time_grid'], results['epe_95'], 'b--', label='95% EPE', alpha=0.7)
-        ax1.plot(results['time_grid'], abs(results['ene']), 'r-', label='|ENE|', linewidth=2)
-        ax1.plot(results['time_grid'], abs(results['ene_5']), 'r--', label='5% |ENE|', alpha=0.7)
-        ax1.set_xlabel('Time (years)')
-        ax1.set_ylabel('Exposure ($)')
-        ax1.set_title('Expected Positive/Negative Exposure')
-        ax1.legend()
-        ax1.grid(True, alpha=0.3)
-        ax1.ticklabel_format(style='plain', axis='y')
-        
-        # Plot 2: Sample paths
-        ax2 = fig.add_subplot(1, 2, 2)
-        # Plot first 20 swap value paths
-        for i in range(min(20, results['swap_values'].shape[0])):
-            ax2.plot(results['time_grid'], results['swap_values'][i, :], 
-                    alpha=0.3, color='gray', linewidth=0.5)
-        ax2.plot(results['time_grid'], results['epe'], 'b-', label='EPE', linewidth=2)
-        ax2.plot(results['time_grid'], results['ene'], 'r-', label='ENE', linewidth=2)
-        ax2.axhline(y=0, color='black', linestyle='-', alpha=0.5)
-        ax2.set_xlabel('Time (years)')
-        ax2.set_ylabel('Swap Value ($)')
-        ax2.set_title('Sample Swap Value Paths')
-        ax2.legend()
-        ax2.grid(True, alpha=0.3)
-        ax2.ticklabel_format(style='plain', axis='y')
-        
-        fig.tight_layout()
-        
-        # Embed in tkinter
-        canvas = FigureCanvasTkAgg(fig, master=plot_frame)
-        canvas.draw()
-        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        self.epe_line.set_data(time_grid, results['epe'])
+        self.epe_95_line.set_data(time_grid, results['epe_95'])
+        self.ene_abs_line.set_data(time_grid, abs(results['ene']))
+        self.ene_5_abs_line.set_data(time_grid, abs(results['ene_5']))
+        
+        # Plot 2: sample swap value paths, kept beneath the EPE/ENE lines
+        num_paths = sample_paths.shape[1]
+        while len(self.path_lines) < num_paths:
+            line, = self.ax2.plot([], [], alpha=0.3, color='gray', linewidth=0.5, zorder=1)
+            self.path_lines.append(line)
+        while len(self.path_lines) > num_paths:
+            self.path_lines.pop().remove()
+        for i, line in enumerate(self.path_lines):
+            line.set_data(time_grid, sample_paths[:, i])
+        self.ax2_epe_line.set_data(time_grid, results['epe'])
+        self.ax2_ene_line.set_data(time_grid, results['ene'])
+        
+        # Rescale to the new data and redraw when Tk is next idle
+        for ax in (self.ax1, self.ax2):
+            ax.relim()
+            ax.autoscale_view()
+        self.fig.tight_layout()
+        self.canvas.draw_idle()
 
 def main():
     """Main function to run the GUI"""